@@ -11,6 +11,15 @@ class Settings(BaseSettings):
     milvus_port: str = "19530"
     collection_name: str = "recipes_collection"
     cors_origin: str = "http://localhost:3000"
+    context_token_budget: int = 3000
+    context_chars_per_token: int = 4
+    context_max_field_chars: int = 600
+    context_dedup_enabled: bool = True
+    context_dedup_distance: float = 0.02
+    context_min_k: int = 2
+    context_score_gap: float = 0.1
+    warm_up_initial_backoff: float = 1.0
+    warm_up_max_backoff: float = 30.0
 
 
 settings = Settings()
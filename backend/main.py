@@ -1,9 +1,52 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from pymilvus import MilvusException
 from .routes import recipes
 from .config import settings
+from .services.recipe_service import warm_up_services
+
+logger = logging.getLogger(__name__)
+
+
+async def run_warm_up(app: FastAPI):
+    backoff = settings.warm_up_initial_backoff
+    attempt = 1
+    while True:
+        try:
+            await warm_up_services()
+            break
+        except MilvusException as e:
+            logger.warning(
+                f"Warm-up attempt {attempt} failed: {e}. Retrying in {backoff:.0f}s."
+            )
+        except Exception:
+            logger.exception(
+                f"Warm-up attempt {attempt} failed unexpectedly. "
+                f"Retrying in {backoff:.0f}s."
+            )
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, settings.warm_up_max_backoff)
+        attempt += 1
+    app.state.ready = True
+    logger.info("Warm-up completed.")
+
 
-app = FastAPI(title="Cookidoo Agent API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.ready = False
+    warm_up_task = asyncio.create_task(run_warm_up(app))
+    yield
+    warm_up_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await warm_up_task
+
+
+app = FastAPI(title="Cookidoo Agent API", lifespan=lifespan)
 
 app.include_router(recipes.router, prefix="/recipes")
 
@@ -21,3 +64,10 @@ async def root():
     return {
         "message": "Cookidoo Agent API. Use endpoints /recipes/load-db or /recipes/query."
     }
+
+
+@app.get("/ready")
+async def ready():
+    if not app.state.ready:
+        return JSONResponse(status_code=503, content={"ready": False})
+    return {"ready": True}
@@ -0,0 +1,97 @@
+import logging
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+SEPARATOR = "\n\n"
+TRUNCATED_FIELDS = ("Ingredients: ", "Nutrition: ")
+FIELD_TERMINATORS = {
+    "Ingredients: ": ". Nutrition: ",
+    "Nutrition: ": ". Total times: ",
+}
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // settings.context_chars_per_token)
+
+
+def l2_distance(a: list[float], b: list[float]) -> float:
+    # Squared L2, same as the metric Milvus reports for the "L2" index.
+    return sum((x - y) ** 2 for x, y in zip(a, b))
+
+
+def select_by_score_gap(hits: list[dict]) -> list[dict]:
+    if len(hits) <= settings.context_min_k:
+        return hits
+    best_gap = 0.0
+    cut = len(hits)
+    for i in range(settings.context_min_k, len(hits)):
+        gap = hits[i]["distance"] - hits[i - 1]["distance"]
+        if gap > best_gap:
+            best_gap = gap
+            cut = i
+    if best_gap < settings.context_score_gap:
+        return hits
+    logger.debug(f"Score gap {best_gap:.3f} found, keeping top {cut} recipes")
+    return hits[:cut]
+
+
+def drop_near_duplicates(hits: list[dict]) -> list[dict]:
+    if not settings.context_dedup_enabled:
+        return hits
+    kept = []
+    for hit in hits:
+        embedding = hit.get("embedding")
+        if embedding and any(
+            other.get("embedding")
+            and l2_distance(embedding, other["embedding"])
+            < settings.context_dedup_distance
+            for other in kept
+        ):
+            logger.debug(f"Dropping near-duplicate recipe: {hit.get('title')}")
+            continue
+        kept.append(hit)
+    return kept
+
+
+def truncate_fields(text: str, max_chars: int) -> str:
+    for label in TRUNCATED_FIELDS:
+        start = text.find(label)
+        if start == -1:
+            continue
+        start += len(label)
+        end = text.find(FIELD_TERMINATORS[label], start)
+        if end == -1:
+            end = len(text)
+        if end - start > max_chars:
+            text = text[: start + max_chars].rstrip(", ") + "…" + text[end:]
+    return text
+
+
+def build_rerank_context(hits: list[dict]) -> str:
+    hits = sorted(hits, key=lambda hit: hit["distance"])
+    hits = select_by_score_gap(drop_near_duplicates(hits))
+
+    budget = settings.context_token_budget
+    parts = []
+    used = 0
+    separator_tokens = estimate_tokens(SEPARATOR)
+    for hit in hits:
+        text = truncate_fields(
+            hit.get("condensed_text") or "", settings.context_max_field_chars
+        )
+        tokens = estimate_tokens(text)
+        if parts:
+            tokens += separator_tokens
+        if used + tokens > budget:
+            if parts:
+                break
+            text = text[: budget * settings.context_chars_per_token]
+            tokens = estimate_tokens(text)
+        parts.append(text)
+        used += tokens
+    logger.info(
+        f"Re-ranking context: {len(parts)} of {len(hits)} recipes, ~{used} tokens"
+    )
+    return SEPARATOR.join(parts)
@@ -1,13 +1,18 @@
 import aiohttp
+import grpc
 import logging
+import threading
+from typing import Optional
 from pymilvus import (
     connections,
     FieldSchema,
     CollectionSchema,
     DataType,
     Collection,
+    MilvusException,
     utility,
 )
+from pymilvus.exceptions import ConnectionNotExistException
 
 from backend.cookidoo import Cookidoo
 from backend.cookidoo.helpers import get_localization_options
@@ -17,8 +22,56 @@ from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+_loaded_collection: Optional[Collection] = None
+_collection_lock = threading.Lock()
+
+RECOVERABLE_SEARCH_ERRORS = ("not loaded", "unavailable", "connection", "channel")
+
+
+def collection_is_loadable() -> bool:
+    connections.connect("default", host=settings.milvus_host, port=settings.milvus_port)
+    if not utility.has_collection(settings.collection_name):
+        return False
+    # The index is only built at the end of run_initial_load, so an interrupted
+    # load leaves a collection that exists but cannot be loaded.
+    return bool(utility.list_indexes(settings.collection_name))
+
+
+def get_loaded_collection() -> Collection:
+    global _loaded_collection
+    with _collection_lock:
+        if _loaded_collection is None:
+            connections.connect(
+                "default", host=settings.milvus_host, port=settings.milvus_port
+            )
+            collection = Collection(settings.collection_name)
+            collection.load()
+            _loaded_collection = collection
+        return _loaded_collection
+
+
+def reset_loaded_collection(stale: Collection):
+    global _loaded_collection
+    with _collection_lock:
+        # Another thread may already have reconnected and loaded a fresh collection.
+        if _loaded_collection is stale:
+            _loaded_collection = None
+            connections.disconnect("default")
+
+
+def is_recoverable_search_error(exc: Exception) -> bool:
+    if isinstance(exc, ConnectionNotExistException):
+        return True
+    if isinstance(exc, grpc.RpcError):
+        return exc.code() == grpc.StatusCode.UNAVAILABLE
+    message = str(exc).lower()
+    return any(marker in message for marker in RECOVERABLE_SEARCH_ERRORS)
+
 
 def create_collection() -> Collection:
+    global _loaded_collection
+    with _collection_lock:
+        _loaded_collection = None
     connections.connect("default", host=settings.milvus_host, port=settings.milvus_port)
     if utility.has_collection(settings.collection_name):
         logger.info(f"Dropping existing collection: {settings.collection_name}")
@@ -61,6 +114,8 @@ def create_index(collection: Collection):
 async def run_initial_load():
     import asyncio
 
+    global _loaded_collection
+
     connector = aiohttp.TCPConnector(limit=1000)
     async with aiohttp.ClientSession(connector=connector) as session:
         localization = (await get_localization_options(country="ie", language="en-GB"))[
@@ -100,22 +155,52 @@ async def run_initial_load():
         create_index(collection)
         logger.info("All recipes have been processed and stored in Milvus.")
 
+        with _collection_lock:
+            collection.load()
+            _loaded_collection = collection
+        logger.info("Collection loaded into memory.")
+
 
 def query_collection(query_embedding: list, top_k: int = 10) -> list:
-    connections.connect("default", host=settings.milvus_host, port=settings.milvus_port)
-    collection = Collection(settings.collection_name)
-    collection.load()
+    collection = get_loaded_collection()
+    try:
+        return search_collection(collection, query_embedding, top_k)
+    except (MilvusException, grpc.RpcError) as e:
+        if not is_recoverable_search_error(e):
+            raise
+        logger.warning(
+            f"Search failed, disconnecting and reloading collection before retry: {e}"
+        )
+        reset_loaded_collection(collection)
+        return search_collection(get_loaded_collection(), query_embedding, top_k)
+
+
+def search_collection(
+    collection: Collection, query_embedding: list, top_k: int
+) -> list:
     search_params = {"metric_type": "L2", "params": {"nprobe": 10}}
+    output_fields = ["recipe_id", "title", "condensed_text"]
+    if settings.context_dedup_enabled:
+        # Vectors are only needed for near-duplicate filtering of the re-ranking context.
+        output_fields.append("embedding")
     results = collection.search(
         data=[query_embedding],
         anns_field="embedding",
         param=search_params,
         limit=top_k,
         expr=None,
-        output_fields=["recipe_id", "title", "condensed_text"],
+        output_fields=output_fields,
     )
     retrieved = []
     for hits in results:
         for hit in hits:
-            retrieved.append(hit.entity.get("condensed_text"))
+            retrieved.append(
+                {
+                    "recipe_id": hit.entity.get("recipe_id"),
+                    "title": hit.entity.get("title"),
+                    "condensed_text": hit.entity.get("condensed_text"),
+                    "embedding": hit.entity.get("embedding"),
+                    "distance": hit.distance,
+                }
+            )
     return retrieved
@@ -22,6 +22,15 @@ async def get_openai_embedding(text: str) -> list[float]:
         return []
 
 
+async def warm_up_openai() -> list[float]:
+    # Opens the pooled HTTP/TLS connection and returns an embedding usable as a canary query.
+    # Errors are raised, not swallowed, so a failed priming call fails the warm-up attempt.
+    response = await client.embeddings.create(
+        input="warm-up", model=settings.openai_model_embedding
+    )
+    return response.data[0].embedding
+
+
 async def extract_query_criteria(query: str) -> str:
     prompt = (
         "Na podstawie poniższego zapytania wypunktuj najważniejsze kryteria, "
@@ -1,12 +1,15 @@
 import asyncio
 import logging
 
+from backend.config import settings
 from backend.cookidoo import Cookidoo
 from backend.cookidoo.types import CookidooShoppingRecipeDetails
+from backend.services.context_service import build_rerank_context
 from backend.services.openai_service import (
     extract_query_criteria,
     get_openai_embedding,
     get_re_ranked_recipe,
+    warm_up_openai,
 )
 
 logger = logging.getLogger(__name__)
@@ -22,14 +25,34 @@ async def query_recipes_service(query: str, top_k: int = 10) -> str:
     query_embedding = await get_openai_embedding(condensed_query)
     if not query_embedding:
         return "Nie udało się obliczyć embeddingu zapytania."
-    retrieved_texts = await asyncio.to_thread(query_collection, query_embedding, top_k)
-    if not retrieved_texts:
+    retrieved_hits = await asyncio.to_thread(query_collection, query_embedding, top_k)
+    if not retrieved_hits:
         return "Nie znaleziono przepisów pasujących do zapytania."
-    context = "\n\n".join(retrieved_texts)
+    context = build_rerank_context(retrieved_hits)
     answer = await get_re_ranked_recipe(query, extracted_criteria, context)
     return answer
 
 
+async def warm_up_services():
+    from backend.services.milvus_service import (
+        collection_is_loadable,
+        get_loaded_collection,
+        query_collection,
+    )
+
+    if not await asyncio.to_thread(collection_is_loadable):
+        logger.warning(
+            f"Collection {settings.collection_name} is missing or has no index, "
+            "skipping collection load and canary search."
+        )
+        await warm_up_openai()
+        return
+    _, canary_embedding = await asyncio.gather(
+        asyncio.to_thread(get_loaded_collection), warm_up_openai()
+    )
+    await asyncio.to_thread(query_collection, canary_embedding, 1)
+
+
 def load_vector_database():
     from backend.services.milvus_service import run_initial_load
     